@@ -1,6 +1,9 @@
 import os
 import requests
 import csv
+from functools import lru_cache
+
+session = requests.Session()
 
 def get_canvas_api_token():
     return os.getenv('CANVAS_API_TOKEN')
@@ -14,21 +17,22 @@ def get_courses(api_token, domain):
         "Authorization": f"Bearer {api_token}",
         "Authentication-Provider": "canvas"
     }
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
+@lru_cache(maxsize=None)
 def get_students_in_course(api_token, course_id, domain):
     url = f"https://{domain}/api/v1/courses/{course_id}/students"
     headers = {"Authorization": f"Bearer {api_token}"}
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
 def get_assignments_in_course(api_token, course_id, domain):
     url = f"https://{domain}/api/v1/courses/{course_id}/assignments"
     headers = {"Authorization": f"Bearer {api_token}"}
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
@@ -36,7 +40,7 @@ def update_student_grade(api_token, course_id, assignment_id, student_id, grade,
     url = f"https://{domain}/api/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{student_id}"
     headers = {"Authorization": f"Bearer {api_token}", "Content-Type": "application/json"}
     data = {"submission": {"posted_grade": grade}}
-    response = requests.put(url, headers=headers, json=data)
+    response = session.put(url, headers=headers, json=data)
     response.raise_for_status()
     return response.json()
 def create_csv_for_students(courses, api_token, domain):